@@ -1,4 +1,8 @@
-from typing import Generator
+import copy
+import os
+from fractions import Fraction
+from math import isclose, sqrt
+from typing import Callable, Generator, Iterable
 
 class Matrix:
     def __init__(self, width:int, height:int, content:list[float] = None):
@@ -38,17 +42,149 @@ class Matrix:
     def __scalar_mult(m1, scalar):
         return Matrix(m1.width, m1.height, [v1 * scalar for v1 in m1.content])
 
+    @staticmethod
+    def __fraction_free_elimination(m, pivot_cols: int, reduce: bool) -> tuple:
+        """Bareiss elimination in place over the first pivot_cols columns of m.
+
+        Every division is exact, so integer and Fraction entries never leave their type and
+        never grow beyond the size of a minor of the input. With reduce, rows above each pivot
+        are eliminated too (Gauss-Jordan). Returns (rank, sign of the row swaps, last pivot).
+        """
+        content: list = m.content
+        width: int = m.width
+
+        integer: bool = all(type(v) == int for v in content)
+
+        rank: int = 0
+        sign: int = 1
+        previous = 1
+        for col in range(pivot_cols):
+            if rank == m.height:
+                break
+
+            # Looks for the next row with a non zero value in this column
+            for row_number in range(rank, m.height):
+                if content[row_number * width + col] != 0:
+                    break
+            else:
+                continue # No pivot in this column
+
+            if row_number != rank:
+                m.swap_row(row_number, rank)
+                sign = -sign
+
+            pivot_begin: int = rank * width
+            pivot = content[pivot_begin + col]
+
+            for row_number in (range(m.height) if reduce else range(rank + 1, m.height)):
+                if row_number == rank:
+                    continue
+                begin: int = row_number * width
+                factor = content[begin + col]
+                row: list = content[begin + col + 1 : begin + width]
+                pivot_row: list = content[pivot_begin + col + 1 : pivot_begin + width]
+                if integer:
+                    content[begin + col + 1 : begin + width] = [(v1 * pivot - factor * v2) // previous for v1, v2 in zip(row, pivot_row)]
+                else:
+                    content[begin + col + 1 : begin + width] = [(v1 * pivot - factor * v2) / previous for v1, v2 in zip(row, pivot_row)]
+                content[begin + col] = 0
+
+            previous = pivot
+            rank += 1
+
+        return rank, sign, previous
+
+    #endregion
+
+    @staticmethod
+    def __square_mult_into(a: list, b: list, columns: list, out: list, n: int, lower: bool, upper: bool) -> None:
+        """Writes the n by n product a * b into out, reusing columns as the transpose buffer of b.
+
+        When both factors are lower (or upper) triangular the sums skip the known zeros.
+        """
+        for row_number in range(n):
+            for col_number in range(n):
+                columns[col_number * n + row_number] = b[row_number * n + col_number]
+
+        for row_number in range(n):
+            row_begin: int = row_number * n
+            for col_number in range(n):
+                begin, end = 0, n
+                if lower:
+                    begin, end = col_number, row_number + 1
+                elif upper:
+                    begin, end = row_number, col_number + 1
+
+                if begin >= end:
+                    out[row_begin + col_number] = 0
+                    continue
+
+                col_begin: int = col_number * n
+                out[row_begin + col_number] = sum(
+                    [v1 * v2 for v1, v2 in zip(a[row_begin + begin : row_begin + end], columns[col_begin + begin : col_begin + end])]
+                )
+
     #endregion
 
     #region Non-Static Ops
     def __mul__ (self, other) -> None:
-        if type(other) in [Matrix, Vector]:
+        if isinstance(other, Matrix):
             return Matrix.__matrix_mult(self, other)
-        elif type(other) in [int, float]:
+        elif type(other) in [int, float, Fraction]:
             return Matrix.__scalar_mult(self, other)
         else:
             raise Exception(f"Invalid operation * between Matrix and {type(other)}")
 
+    def __pow__(self, exponent: int) -> "Matrix":
+        if type(exponent) != int:
+            raise Exception(f"Matrix power is only defined for integer exponents, not {type(exponent)}")
+        if self.width != self.height:
+            raise Exception(f"Only Square matrixes can be raised to a power, matrix {self.width} by {self.height} is not square")
+
+        n: int = self.width
+
+        if exponent == 0:
+            return Matrix(n, n, [1 if i == j else 0 for i in range(n) for j in range(n)])
+
+        # Diagonal matrices only need their diagonal raised element-wise
+        if self.is_diagonal:
+            diagonal: list = [self.content[i * n + i] for i in range(n)]
+            if exponent < 0:
+                if any(v == 0 for v in diagonal):
+                    raise Exception("Matrix does not have a inverse, it has a zero on the diagonal")
+                diagonal = [Fraction(1, v) if type(v) in [int, Fraction] else 1 / v for v in diagonal]
+            content: list = [0] * (n * n)
+            for i, v in enumerate(diagonal):
+                content[i * n + i] = v ** abs(exponent)
+            return Matrix(n, n, content)
+
+        # Negative powers only need a single inverse
+        base: Matrix = self if exponent > 0 else self.inverse
+        exponent = abs(exponent)
+
+        # Powers of triangular matrices stay triangular
+        lower: bool = base.is_lower_triangular
+        upper: bool = not lower and base.is_upper_triangular
+
+        # Binary exponentiation, ping-ponging between preallocated buffers
+        power: list = base.content.copy()
+        scratch: list = [0] * (n * n)
+        columns: list = [0] * (n * n)
+        result: list = None
+        while exponent:
+            if exponent & 1:
+                if result is None:
+                    result = power.copy()
+                else:
+                    Matrix.__square_mult_into(result, power, columns, scratch, n, lower, upper)
+                    result, scratch = scratch, result
+            exponent >>= 1
+            if exponent:
+                Matrix.__square_mult_into(power, power, columns, scratch, n, lower, upper)
+                power, scratch = scratch, power
+
+        return Matrix(n, n, result)
+
     @property
     def T(self) -> "Matrix":
         resulting_matrix: Matrix = Matrix(self.height, self.width)
@@ -62,23 +198,17 @@ class Matrix:
         
         if self.width != self.height:
             raise Exception(f"Only Square matrixes have determinants, matrix {self.width} by {self.height} is not square")
+
+        if self.is_exact:
+            # Fraction-free elimination keeps integer and rational determinants exact
+            replacement_matrix: Matrix = Matrix(self.width, self.height, self.content.copy())
+            rank, sign, last_pivot = Matrix.__fraction_free_elimination(replacement_matrix, self.width, False)
+            return sign * last_pivot if rank == self.height else 0
         
         multiplier: float = 1
 
         replacement_matrix: Matrix = Matrix(self.width, self.height, self.content.copy())
         
-        # Remove all necessary zeros from the diagonal
-        row_number: int = 0
-        while row_number < replacement_matrix.height:
-            if replacement_matrix[row_number, row_number] != 0:
-                row_number += 1
-            elif row_number + 1 == replacement_matrix.height:
-                return 0.0 # Impossible to remove zero from the main diagonal
-            else:
-                replacement_matrix.swap_row(row_number, row_number + 1)
-                multiplier *= -1
-                
-        
         # performs structured gaussian elimination
         for row_number in range(replacement_matrix.height):
 
@@ -142,13 +272,149 @@ class Matrix:
 
 
     
+    @property
+    def rank(self) -> int:
+        replacement_matrix: Matrix = Matrix(self.width, self.height, self.content.copy())
+        return Matrix.__fraction_free_elimination(replacement_matrix, self.width, False)[0]
+
+    def fraction_free_inverse(self) -> tuple["Matrix", int]:
+        """Exact inverse of an integer or rational matrix as (numerators, denominator).
+
+        The inverse is numerators * (1 / denominator), with a single positive common
+        denominator equal to |det|.
+        """
+        if self.width != self.height:
+            raise Exception("Inverse is only defined for square matrices")
+
+        n: int = self.width
+
+        # Augmented matrix [A | I]
+        content: list = []
+        for row_number in range(n):
+            content.extend(self.content[row_number * n : row_number * n + n])
+            content.extend([1 if i == row_number else 0 for i in range(n)])
+        augmented: Matrix = Matrix(2 * n, n, content)
+
+        rank, _, denominator = Matrix.__fraction_free_elimination(augmented, n, True)
+        if rank < n:
+            raise Exception("Matrix does not have a inverse, it is singular")
+
+        # Left block is now denominator * I, so the right block is denominator * A^-1
+        numerators: list = []
+        for row_number in range(n):
+            numerators.extend(augmented.content[row_number * 2 * n + n : row_number * 2 * n + 2 * n])
+        if denominator < 0:
+            numerators = [-v for v in numerators]
+            denominator = -denominator
+
+        return Matrix(n, n, numerators), denominator
+
     @property
     def inverse(self) -> None:
-        determinant: float = self.determinant
-        if determinant == 0:
-            raise Exception(f"Matrix does not have a inverse. Matris: \n {self.display()}")
-        return self.adj * (1/determinant)
+        if self.is_exact:
+            numerators, denominator = self.fraction_free_inverse()
+            return Matrix(self.width, self.height, [Fraction(v, denominator) for v in numerators.content])
+
+        if self.width != self.height:
+            raise Exception("Inverse is only defined for square matrices")
+
+        # Gauss-Jordan elimination on [A | I] with partial pivoting, O(n³)
+        n: int = self.width
+        content: list[float] = []
+        for row_number in range(n):
+            content.extend(self.content[row_number * n : row_number * n + n])
+            content.extend([1.0 if i == row_number else 0.0 for i in range(n)])
+        augmented: Matrix = Matrix(2 * n, n, content)
+
+        for col in range(n):
+            # Chooses the largest pivot for numerical accuracy
+            pivot_row: int = max(range(col, n), key=lambda row_number: abs(content[row_number * 2 * n + col]))
+            if content[pivot_row * 2 * n + col] == 0:
+                raise Exception(f"Matrix does not have a inverse. Matris: \n {self.display()}")
+            if pivot_row != col:
+                augmented.swap_row(pivot_row, col)
+
+            pivot_begin: int = col * 2 * n
+            pivot: float = content[pivot_begin + col]
+            content[pivot_begin : pivot_begin + 2 * n] = [v / pivot for v in content[pivot_begin : pivot_begin + 2 * n]]
+
+            for row_number in range(n):
+                begin: int = row_number * 2 * n
+                factor: float = content[begin + col]
+                if row_number != col and factor != 0:
+                    content[begin : begin + 2 * n] = [v1 - factor * v2 for v1, v2 in zip(content[begin : begin + 2 * n], content[pivot_begin : pivot_begin + 2 * n])]
+
+        inverse: list[float] = []
+        for row_number in range(n):
+            inverse.extend(content[row_number * 2 * n + n : row_number * 2 * n + 2 * n])
+        return Matrix(n, n, inverse)
     
+    @property
+    def is_exact(self) -> bool:
+        return all(type(v) in [int, Fraction] for v in self.content)
+
+    @property
+    def is_diagonal(self) -> bool:
+        return self.is_lower_triangular and self.is_upper_triangular
+
+    @property
+    def is_lower_triangular(self) -> bool:
+        if self.width != self.height:
+            return False
+        return all(self.content[i * self.width + j] == 0 for i in range(self.height) for j in range(i + 1, self.width))
+
+    @property
+    def is_upper_triangular(self) -> bool:
+        if self.width != self.height:
+            return False
+        return all(self.content[i * self.width + j] == 0 for i in range(self.height) for j in range(i))
+
+    @property
+    def is_symmetric(self) -> bool:
+        # Floating point matrices assembled from sums are often only symmetric up to rounding
+        if self.width != self.height:
+            return False
+        for i in range(self.height):
+            for j in range(i):
+                if not isclose(self.content[i * self.width + j], self.content[j * self.width + i], rel_tol=1e-9):
+                    return False
+        return True
+
+    #endregion
+
+    #region Decompositions
+    def cholesky(self) -> "Cholesky":
+        """Factor a symmetric positive definite matrix as L * L^T.
+
+        Raises if the matrix is not square, not symmetric (up to a relative tolerance of 1e-9)
+        or not positive definite. Only the lower triangle is read, so rounding noise in the
+        upper triangle is ignored. The factor keeps only the lower triangle, packed row by row.
+        """
+        if self.width != self.height:
+            raise Exception(f"Cholesky decomposition is only defined for square matrices, matrix {self.width} by {self.height} is not square")
+        if not self.is_symmetric:
+            raise Exception("Cholesky decomposition is only defined for symmetric matrices")
+
+        n: int = self.height
+        packed: list[float] = [0.0] * (n * (n + 1) // 2)
+
+        # Cholesky-Banachiewicz: fills L one row at a time, reading only rows already computed
+        for i in range(n):
+            begin_i: int = i * (i + 1) // 2
+            for j in range(i + 1):
+                begin_j: int = j * (j + 1) // 2
+                value: float = self.content[i * n + j] - sum(
+                    [v1 * v2 for v1, v2 in zip(packed[begin_i : begin_i + j], packed[begin_j : begin_j + j])]
+                )
+                if i == j:
+                    if value <= 0:
+                        raise Exception(f"Matrix is not positive definite (pivot {i} is {value})")
+                    packed[begin_i + i] = sqrt(value)
+                else:
+                    packed[begin_i + j] = value / packed[begin_j + j]
+
+        return Cholesky(n, packed)
+
     #endregion
 
     def swap_row(self, x: int, y: int) -> None:
@@ -158,18 +424,16 @@ class Matrix:
         if x >= self.height or y >= self.height:
             raise Exception(f"Rows outside of the boundrie [0,{self.height-1}]")
         
-        begin_x: int = x * self.height
-        begin_y: int = y * self.height
+        begin_x: int = x * self.width
+        begin_y: int = y * self.width
 
-        row_x: list[float] = self.content[begin_x : begin_x + self.height]
+        row_x: list[float] = self.content[begin_x : begin_x + self.width]
 
         # Replace row x with row y info
-        for i in range(self.width):
-            self.content[ begin_x + i ] = self.content[ begin_y + i ]
+        self.content[begin_x : begin_x + self.width] = self.content[begin_y : begin_y + self.width]
 
         # Replace row y with row x info
-        for i, val in enumerate(row_x):
-            self.content[ begin_y + i ] = val, 
+        self.content[begin_y : begin_y + self.width] = row_x
     
     # region Iter Tools
     def row(self, i: int) -> Generator[float, None, None]:
@@ -193,13 +457,20 @@ class Matrix:
     #endregion
 
     #region Index Access
-    def __getitem__(self, index) -> float:
+    def _check_index(self, index) -> None:
         if type(index) != tuple:
             raise Exception("A (row, col) touple must be provided when accessing index")
         if len(index) != 2:
             raise Exception("Number of tuple parameter for position must be 2")
         if type(index[0]) != int or type(index[1]) != int:
             raise Exception(f"Row and col values must be integers not ({type(index[0])}, {type(index[1])})")
+
+    def _check_bounds(self, index) -> None:
+        if not (0 <= index[0] < self.height and 0 <= index[1] < self.width):
+            raise IndexError(f"Index ({index[0], index[1]}) is out of boundy of matrix of size ({self.height},{self.width})")
+
+    def __getitem__(self, index) -> float:
+        self._check_index(index)
         
         try:
             return self.content[index[0] * self.width + index[1]]
@@ -207,12 +478,7 @@ class Matrix:
             raise IndexError(f"Index ({index[0], index[1]}) is out of boundy of matrix of size ({self.height},{self.width})")
 
     def __setitem__(self, index, value: float) -> None:
-        if type(index) != tuple:
-            raise Exception("A (row, col) touple must be provided when accessing index")
-        if len(index) != 2:
-            raise Exception("Number of tuple parameter for position must be 2")
-        if type(index[0]) != int or type(index[1]) != int:
-            raise Exception(f"Row and col values must be integers not ({type(index[0])}, {type(index[1])})")
+        self._check_index(index)
         
         try:
             self.content[index[0] * self.width + index[1]] = value
@@ -224,9 +490,841 @@ class Matrix:
         for row in self.rows:
             print(" | ".join([f"{x:.2f}" for x in row]))
 
+    #region Text IO
+    @staticmethod
+    def __csv_lines(path_or_stream, chunk_size: int) -> Generator[str, None, None]:
+        """Yields the non empty lines of a file path or text stream, reading chunk_size characters at a time."""
+        if isinstance(path_or_stream, (str, os.PathLike)):
+            with open(path_or_stream, "r", newline="") as stream:
+                yield from Matrix.__csv_lines(stream, chunk_size)
+            return
+
+        remainder: str = ""
+        while True:
+            chunk: str = path_or_stream.read(chunk_size)
+            if not chunk:
+                break
+            lines: list[str] = (remainder + chunk).split("\n")
+            remainder = lines.pop() # Last line may continue in the next chunk
+            for line in lines:
+                line = line.strip()
+                if line:
+                    yield line
+
+        remainder = remainder.strip()
+        if remainder:
+            yield remainder
+
+    @staticmethod
+    def csv_rows(path_or_stream, delimiter: str = ",", parse: Callable[[str], float] = float, chunk_size: int = 1 << 20) -> Generator[list[float], None, None]:
+        """Yields the rows of a numeric CSV one at a time, for matrices too big to hold in memory."""
+        for line in Matrix.__csv_lines(path_or_stream, chunk_size):
+            yield [parse(v) for v in line.split(delimiter)]
+
+    @staticmethod
+    def from_csv(path_or_stream, delimiter: str = ",", parse: Callable[[str], float] = float, chunk_size: int = 1 << 20) -> "Matrix":
+        """Reads a numeric CSV straight into the flat storage of a Matrix.
+
+        Values are converted with parse, use int or Fraction to get an exact matrix.
+        """
+        content: list[float] = []
+        width: int = 0
+        height: int = 0
+        for line in Matrix.__csv_lines(path_or_stream, chunk_size):
+            values: list[str] = line.split(delimiter)
+            if height == 0:
+                width = len(values)
+            elif len(values) != width:
+                raise Exception(f"Row {height} has {len(values)} values, expected {width}")
+            content.extend(map(parse, values))
+            height += 1
+
+        if height == 0:
+            raise Exception("Matrix cannot have a dimension of size zero")
+        return Matrix(width, height, content)
+
+    @staticmethod
+    def write_csv_rows(rows: Iterable[Iterable[float]], path_or_stream, delimiter: str = ",", chunk_size: int = 1 << 20) -> None:
+        """Writes rows as CSV at full precision, buffering about chunk_size characters per write."""
+        if isinstance(path_or_stream, (str, os.PathLike)):
+            with open(path_or_stream, "w", newline="") as stream:
+                Matrix.write_csv_rows(rows, stream, delimiter, chunk_size)
+            return
+
+        # str gives the shortest text that reads back to the same float, and n/d for Fractions
+        buffer: list[str] = []
+        buffered: int = 0
+        for row in rows:
+            line: str = delimiter.join(map(str, row)) + "\n"
+            buffer.append(line)
+            buffered += len(line)
+            if buffered >= chunk_size:
+                path_or_stream.write("".join(buffer))
+                buffer, buffered = [], 0
+
+        if buffer:
+            path_or_stream.write("".join(buffer))
+
+    def write(self, stream, delimiter: str = ",", chunk_size: int = 1 << 20) -> None:
+        content: list[float] = self.content
+        width: int = self.width
+        rows = (content[i * width : i * width + width] for i in range(self.height))
+        Matrix.write_csv_rows(rows, stream, delimiter, chunk_size)
+
+    def to_csv(self, path_or_stream, delimiter: str = ",", chunk_size: int = 1 << 20) -> None:
+        self.write(path_or_stream, delimiter, chunk_size)
+
+    #endregion
+
 class Vector(Matrix):
     def __init__(self, size, content = None):
         super().__init__(1, size, content)
-    
 
-        
+
+class DiagonalMatrix(Matrix):
+    """Square matrix that is zero outside the main diagonal, storing only the diagonal."""
+    def __init__(self, size: int, diagonal: list[float] = None):
+        if type(size) != int:
+            raise Exception(f"Size must be an interger, not {type(size)}")
+        if size == 0:
+            raise Exception("Matrix cannot have a dimension of size zero")
+
+        if not diagonal:
+            diagonal = [0 for _ in range(size)]
+
+        if len(diagonal) != size:
+            raise Exception("Size paramentes do not match with the diagonal size")
+
+        self.width, self.height = size, size
+        self.diagonal = diagonal
+
+    @property
+    def content(self) -> list[float]:
+        n: int = self.width
+        content: list[float] = [0] * (n * n)
+        for i, value in enumerate(self.diagonal):
+            content[i * n + i] = value
+        return content
+
+    def __mul__(self, other):
+        n: int = self.width
+        if type(other) in [int, float, Fraction]:
+            return DiagonalMatrix(n, [v * other for v in self.diagonal])
+
+        if not isinstance(other, Matrix):
+            raise Exception(f"Invalid operation * between Matrix and {type(other)}")
+        if other.height != n:
+            raise Exception("Matrix multiplication is only allowed if matrix A has the same number of columns as matrix B has of rows")
+
+        if isinstance(other, DiagonalMatrix):
+            return DiagonalMatrix(n, [v1 * v2 for v1, v2 in zip(self.diagonal, other.diagonal)])
+
+        # Scales each row of other, O(n * width)
+        content: list[float] = other.content
+        width: int = other.width
+        result: list[float] = []
+        for row_number, value in enumerate(self.diagonal):
+            result.extend([value * v for v in content[row_number * width : row_number * width + width]])
+
+        if type(other) == Vector:
+            return Vector(n, result)
+        return Matrix(width, n, result)
+
+    def __rmul__(self, other):
+        n: int = self.width
+        if type(other) in [int, float, Fraction]:
+            return self * other
+
+        if not isinstance(other, Matrix):
+            raise Exception(f"Invalid operation * between {type(other)} and Matrix")
+        if other.width != n:
+            raise Exception("Matrix multiplication is only allowed if matrix A has the same number of columns as matrix B has of rows")
+
+        # Scales each column of other, O(height * n)
+        diagonal: list[float] = self.diagonal
+        return Matrix(n, other.height, [v * diagonal[i % n] for i, v in enumerate(other.content)])
+
+    def __pow__(self, exponent: int) -> "DiagonalMatrix":
+        if type(exponent) != int:
+            raise Exception(f"Matrix power is only defined for integer exponents, not {type(exponent)}")
+        if exponent < 0:
+            return self.inverse ** -exponent
+        return DiagonalMatrix(self.width, [v ** exponent for v in self.diagonal])
+
+    @property
+    def T(self) -> "DiagonalMatrix":
+        return DiagonalMatrix(self.width, self.diagonal.copy())
+
+    @property
+    def determinant(self) -> float:
+        determinant: float = 1
+        for value in self.diagonal:
+            determinant *= value
+        return determinant
+
+    @property
+    def inverse(self) -> "DiagonalMatrix":
+        if any(v == 0 for v in self.diagonal):
+            raise Exception("Matrix does not have a inverse, it has a zero on the diagonal")
+        return DiagonalMatrix(self.width, [Fraction(1, v) if type(v) in [int, Fraction] else 1 / v for v in self.diagonal])
+
+    def swap_row(self, x: int, y: int) -> None:
+        raise Exception("Swapping rows would break the structure of a DiagonalMatrix")
+
+    def __getitem__(self, index) -> float:
+        self._check_index(index)
+        self._check_bounds(index)
+        return self.diagonal[index[0]] if index[0] == index[1] else 0
+
+    def __setitem__(self, index, value: float) -> None:
+        self._check_index(index)
+        self._check_bounds(index)
+        if index[0] == index[1]:
+            self.diagonal[index[0]] = value
+        elif value != 0:
+            raise Exception("A DiagonalMatrix can only hold non zero values on the main diagonal")
+
+class Identity(DiagonalMatrix):
+    """Immutable identity matrix, multiplying by it only copies the other operand."""
+    def __init__(self, size: int):
+        super().__init__(size, [1 for _ in range(size)])
+
+    def __mul__(self, other):
+        if type(other) in [int, float, Fraction]:
+            return DiagonalMatrix(self.width, [other for _ in range(self.width)])
+        if not isinstance(other, Matrix):
+            raise Exception(f"Invalid operation * between Matrix and {type(other)}")
+        if other.height != self.width:
+            raise Exception("Matrix multiplication is only allowed if matrix A has the same number of columns as matrix B has of rows")
+        return copy.deepcopy(other)
+
+    def __rmul__(self, other):
+        if type(other) in [int, float, Fraction]:
+            return self * other
+        if not isinstance(other, Matrix):
+            raise Exception(f"Invalid operation * between {type(other)} and Matrix")
+        if other.width != self.width:
+            raise Exception("Matrix multiplication is only allowed if matrix A has the same number of columns as matrix B has of rows")
+        return copy.deepcopy(other)
+
+    def __pow__(self, exponent: int) -> "Identity":
+        if type(exponent) != int:
+            raise Exception(f"Matrix power is only defined for integer exponents, not {type(exponent)}")
+        return Identity(self.width)
+
+    @property
+    def T(self) -> "Identity":
+        return Identity(self.width)
+
+    @property
+    def determinant(self) -> int:
+        return 1
+
+    @property
+    def inverse(self) -> "Identity":
+        return Identity(self.width)
+
+    def __setitem__(self, index, value: float) -> None:
+        raise Exception("Identity matrix cannot be modified")
+
+class TriangularMatrix(Matrix):
+    """Square matrix that is zero on one side of the main diagonal.
+
+    Only the other side is stored, packed row by row, so it takes about half the memory
+    of a dense matrix. Use LowerTriangular or UpperTriangular.
+    """
+    lower: bool = True
+
+    def __init__(self, size: int, content: list[float] = None):
+        if type(size) != int:
+            raise Exception(f"Size must be an interger, not {type(size)}")
+        if size == 0:
+            raise Exception("Matrix cannot have a dimension of size zero")
+
+        if not content:
+            content = [0 for _ in range(size * (size + 1) // 2)]
+
+        if len(content) != size * (size + 1) // 2:
+            raise Exception("Size paramentes do not match with the packed triangle size")
+
+        self.width, self.height = size, size
+        self.packed = content
+
+    def _span(self, row: int) -> tuple[int, int]:
+        # Columns [begin, end) that are stored for this row
+        if self.lower:
+            return 0, row + 1
+        return row, self.width
+
+    def _offset(self, row: int) -> int:
+        # Position in packed of the first stored value of this row
+        if self.lower:
+            return row * (row + 1) // 2
+        return row * self.width - row * (row - 1) // 2
+
+    @property
+    def content(self) -> list[float]:
+        n: int = self.width
+        content: list[float] = [0] * (n * n)
+        for row_number in range(n):
+            begin, end = self._span(row_number)
+            offset: int = self._offset(row_number)
+            content[row_number * n + begin : row_number * n + end] = self.packed[offset : offset + end - begin]
+        return content
+
+    def __mul__(self, other):
+        n: int = self.width
+        if type(other) in [int, float, Fraction]:
+            return type(self)(n, [v * other for v in self.packed])
+
+        if not isinstance(other, Matrix):
+            raise Exception(f"Invalid operation * between Matrix and {type(other)}")
+        if other.height != n:
+            raise Exception("Matrix multiplication is only allowed if matrix A has the same number of columns as matrix B has of rows")
+
+        if isinstance(other, TriangularMatrix) and other.lower == self.lower:
+            # Product of two triangles of the same side stays triangular, O(n³ / 6)
+            result: TriangularMatrix = type(self)(n)
+            for row_number in range(n):
+                begin, end = self._span(row_number)
+                offset: int = self._offset(row_number)
+                result_offset: int = result._offset(row_number)
+                for col_number in range(begin, end):
+                    # Only k between row and col hits non zero values on both sides
+                    k_begin, k_end = (col_number, row_number + 1) if self.lower else (row_number, col_number + 1)
+                    result.packed[result_offset + col_number - begin] = sum(
+                        [self.packed[offset + k - begin] * other.packed[other._offset(k) + col_number - other._span(k)[0]] for k in range(k_begin, k_end)]
+                    )
+            return result
+
+        # Combines only the rows of other that meet stored values, O(n² * width / 2)
+        content: list[float] = other.content
+        width: int = other.width
+        result_content: list[float] = []
+        for row_number in range(n):
+            begin, end = self._span(row_number)
+            offset: int = self._offset(row_number)
+            row: list[float] = [0] * width
+            for k in range(begin, end):
+                value: float = self.packed[offset + k - begin]
+                if value != 0:
+                    row = [v1 + value * v2 for v1, v2 in zip(row, content[k * width : k * width + width])]
+            result_content.extend(row)
+
+        if type(other) == Vector:
+            return Vector(n, result_content)
+        return Matrix(width, n, result_content)
+
+    def __rmul__(self, other):
+        n: int = self.width
+        if type(other) in [int, float, Fraction]:
+            return self * other
+
+        if not isinstance(other, Matrix):
+            raise Exception(f"Invalid operation * between {type(other)} and Matrix")
+        if other.width != n:
+            raise Exception("Matrix multiplication is only allowed if matrix A has the same number of columns as matrix B has of rows")
+
+        # Each row of the result combines the stored part of the rows of self, O(height * n² / 2)
+        content: list[float] = other.content
+        result_content: list[float] = []
+        for row_number in range(other.height):
+            row: list[float] = [0] * n
+            for k in range(n):
+                value: float = content[row_number * n + k]
+                if value != 0:
+                    begin, end = self._span(k)
+                    offset: int = self._offset(k)
+                    row[begin:end] = [v1 + value * v2 for v1, v2 in zip(row[begin:end], self.packed[offset : offset + end - begin])]
+            result_content.extend(row)
+        return Matrix(n, other.height, result_content)
+
+    @property
+    def T(self) -> "TriangularMatrix":
+        n: int = self.width
+        transposed: TriangularMatrix = UpperTriangular(n) if self.lower else LowerTriangular(n)
+        for row_number in range(n):
+            begin, end = self._span(row_number)
+            offset: int = self._offset(row_number)
+            for col_number in range(begin, end):
+                transposed[col_number, row_number] = self.packed[offset + col_number - begin]
+        return transposed
+
+    @property
+    def determinant(self) -> float:
+        determinant: float = 1
+        for i in range(self.width):
+            determinant *= self.packed[self._offset(i) + i - self._span(i)[0]]
+        return determinant
+
+    def solve(self, b: Matrix) -> Matrix:
+        """Solve self * x = b by forward or back substitution, O(n²) per column of b."""
+        n: int = self.width
+        if b.height != n:
+            raise Exception(f"Right-hand side must have {n} rows, not {b.height}")
+
+        diagonal: list[float] = [self.packed[self._offset(i) + i - self._span(i)[0]] for i in range(n)]
+        if any(v == 0 for v in diagonal):
+            raise Exception("Matrix is singular, it has a zero on the diagonal")
+
+        exact: bool = all(type(v) in [int, Fraction] for v in self.packed) and b.is_exact
+        order: range = range(n) if self.lower else range(n - 1, -1, -1)
+
+        content: list[float] = [0] * (b.width * n)
+        for col_number in range(b.width):
+            x: list[float] = [Fraction(v) if exact else v for v in b.col(col_number)]
+            for i in order:
+                begin, end = self._span(i)
+                offset: int = self._offset(i)
+                # Every stored value except the diagonal multiplies an already solved x
+                value: float = x[i] - sum(
+                    [self.packed[offset + k - begin] * x[k] for k in range(begin, end) if k != i]
+                )
+                x[i] = value / diagonal[i]
+            for row_number, value in enumerate(x):
+                content[row_number * b.width + col_number] = value
+
+        if type(b) == Vector:
+            return Vector(n, content)
+        return Matrix(b.width, n, content)
+
+    @property
+    def inverse(self) -> "TriangularMatrix":
+        n: int = self.width
+        solved: Matrix = self.solve(Identity(n))
+        inverse: TriangularMatrix = type(self)(n)
+        for row_number in range(n):
+            begin, end = inverse._span(row_number)
+            offset: int = inverse._offset(row_number)
+            inverse.packed[offset : offset + end - begin] = solved.content[row_number * n + begin : row_number * n + end]
+        return inverse
+
+    def swap_row(self, x: int, y: int) -> None:
+        raise Exception("Swapping rows would break the structure of a TriangularMatrix")
+
+    def __getitem__(self, index) -> float:
+        self._check_index(index)
+        self._check_bounds(index)
+        begin, end = self._span(index[0])
+        if begin <= index[1] < end:
+            return self.packed[self._offset(index[0]) + index[1] - begin]
+        return 0
+
+    def __setitem__(self, index, value: float) -> None:
+        self._check_index(index)
+        self._check_bounds(index)
+        begin, end = self._span(index[0])
+        if begin <= index[1] < end:
+            self.packed[self._offset(index[0]) + index[1] - begin] = value
+        elif value != 0:
+            raise Exception(f"A {type(self).__name__} cannot hold non zero values on the other side of the diagonal")
+
+class LowerTriangular(TriangularMatrix):
+    """Square matrix that is zero above the main diagonal. Row i stores columns 0 to i."""
+    lower: bool = True
+
+class UpperTriangular(TriangularMatrix):
+    """Square matrix that is zero below the main diagonal. Row i stores columns i to n - 1."""
+    lower: bool = False
+
+class BandedMatrix(Matrix):
+    """Square matrix that is zero further than lower_bandwidth below or upper_bandwidth above the diagonal.
+
+    Each row stores lower_bandwidth + upper_bandwidth + 1 values centred on the diagonal,
+    slots that fall outside the matrix are kept at zero.
+    """
+    def __init__(self, size: int, lower_bandwidth: int, upper_bandwidth: int, content: list[float] = None):
+        if type(size) != int or type(lower_bandwidth) != int or type(upper_bandwidth) != int:
+            raise Exception(f"Size and bandwidths must be intergers, not {type(size), type(lower_bandwidth), type(upper_bandwidth)}")
+        if size == 0:
+            raise Exception("Matrix cannot have a dimension of size zero")
+        if not (0 <= lower_bandwidth < size and 0 <= upper_bandwidth < size):
+            raise Exception(f"Bandwidths must be in the range [0,{size - 1}]")
+
+        band_width: int = lower_bandwidth + upper_bandwidth + 1
+        if not content:
+            content = [0 for _ in range(size * band_width)]
+
+        if len(content) != size * band_width:
+            raise Exception("Size paramentes do not match with the band size")
+
+        self.width, self.height = size, size
+        self.lower_bandwidth, self.upper_bandwidth = lower_bandwidth, upper_bandwidth
+        self.band = content
+
+    @property
+    def band_width(self) -> int:
+        return self.lower_bandwidth + self.upper_bandwidth + 1
+
+    def _span(self, row: int) -> tuple[int, int]:
+        # Columns [begin, end) of this row that lie inside both the band and the matrix
+        return max(0, row - self.lower_bandwidth), min(self.width, row + self.upper_bandwidth + 1)
+
+    def _position(self, row: int, col: int) -> int:
+        return row * self.band_width + col - row + self.lower_bandwidth
+
+    @property
+    def content(self) -> list[float]:
+        n: int = self.width
+        content: list[float] = [0] * (n * n)
+        for row_number in range(n):
+            begin, end = self._span(row_number)
+            content[row_number * n + begin : row_number * n + end] = self.band[self._position(row_number, begin) : self._position(row_number, end)]
+        return content
+
+    def __mul__(self, other):
+        n: int = self.width
+        if type(other) in [int, float, Fraction]:
+            return BandedMatrix(n, self.lower_bandwidth, self.upper_bandwidth, [v * other for v in self.band])
+
+        if not isinstance(other, Matrix):
+            raise Exception(f"Invalid operation * between Matrix and {type(other)}")
+        if other.height != n:
+            raise Exception("Matrix multiplication is only allowed if matrix A has the same number of columns as matrix B has of rows")
+
+        if isinstance(other, BandedMatrix):
+            # Bandwidths add up, O(n * bandwidth * other bandwidth)
+            result: BandedMatrix = BandedMatrix(
+                n,
+                min(n - 1, self.lower_bandwidth + other.lower_bandwidth),
+                min(n - 1, self.upper_bandwidth + other.upper_bandwidth),
+            )
+            for row_number in range(n):
+                begin, end = self._span(row_number)
+                for col_number in range(*result._span(row_number)):
+                    # Rows of other whose band reaches this column
+                    k_begin: int = max(begin, col_number - other.upper_bandwidth)
+                    k_end: int = min(end, col_number + other.lower_bandwidth + 1)
+                    result.band[result._position(row_number, col_number)] = sum(
+                        [self.band[self._position(row_number, k)] * other.band[other._position(k, col_number)] for k in range(k_begin, k_end)]
+                    )
+            return result
+
+        # Combines only the rows of other inside the band, O(n * bandwidth * width)
+        content: list[float] = other.content
+        width: int = other.width
+        result_content: list[float] = []
+        for row_number in range(n):
+            begin, end = self._span(row_number)
+            row: list[float] = [0] * width
+            for k in range(begin, end):
+                value: float = self.band[self._position(row_number, k)]
+                if value != 0:
+                    row = [v1 + value * v2 for v1, v2 in zip(row, content[k * width : k * width + width])]
+            result_content.extend(row)
+
+        if type(other) == Vector:
+            return Vector(n, result_content)
+        return Matrix(width, n, result_content)
+
+    def __rmul__(self, other):
+        n: int = self.width
+        if type(other) in [int, float, Fraction]:
+            return self * other
+
+        if not isinstance(other, Matrix):
+            raise Exception(f"Invalid operation * between {type(other)} and Matrix")
+        if other.width != n:
+            raise Exception("Matrix multiplication is only allowed if matrix A has the same number of columns as matrix B has of rows")
+
+        # Each row of the result combines the band of the rows of self, O(height * n * bandwidth)
+        content: list[float] = other.content
+        result_content: list[float] = []
+        for row_number in range(other.height):
+            row: list[float] = [0] * n
+            for k in range(n):
+                value: float = content[row_number * n + k]
+                if value != 0:
+                    begin, end = self._span(k)
+                    band_row: list[float] = self.band[self._position(k, begin) : self._position(k, end)]
+                    row[begin:end] = [v1 + value * v2 for v1, v2 in zip(row[begin:end], band_row)]
+            result_content.extend(row)
+        return Matrix(n, other.height, result_content)
+
+    @property
+    def T(self) -> "BandedMatrix":
+        transposed: BandedMatrix = BandedMatrix(self.width, self.upper_bandwidth, self.lower_bandwidth)
+        for row_number in range(self.width):
+            for col_number in range(*self._span(row_number)):
+                transposed.band[transposed._position(col_number, row_number)] = self.band[self._position(row_number, col_number)]
+        return transposed
+
+    def __band_factor(self) -> list[float]:
+        """LU factorization inside the band, without pivoting, O(n * lower_bandwidth * upper_bandwidth).
+
+        Returns the band holding U on and above the diagonal and the multipliers of L below it,
+        or None when a zero pivot would need a row swap that breaks the band.
+        """
+        n: int = self.width
+        exact: bool = all(type(v) in [int, Fraction] for v in self.band)
+        band: list[float] = [Fraction(v) for v in self.band] if exact else self.band.copy()
+
+        for k in range(n):
+            pivot: float = band[self._position(k, k)]
+            if pivot == 0:
+                return None
+            for row_number in range(k + 1, min(n, k + self.lower_bandwidth + 1)):
+                factor: float = band[self._position(row_number, k)] / pivot
+                band[self._position(row_number, k)] = factor
+                if factor != 0:
+                    for col_number in range(k + 1, min(n, k + self.upper_bandwidth + 1)):
+                        band[self._position(row_number, col_number)] -= factor * band[self._position(k, col_number)]
+        return band
+
+    @property
+    def determinant(self) -> float:
+        band: list[float] = None
+        if not all(type(v) in [int, Fraction] for v in self.band):
+            band = self.__band_factor()
+        if band is None:
+            # Exact entries keep the fraction-free path, zero pivots need row swaps
+            return super().determinant
+
+        determinant: float = 1
+        for i in range(self.width):
+            determinant *= band[self._position(i, i)]
+        return determinant
+
+    def solve(self, b: Matrix) -> Matrix:
+        """Solve self * x = b using the band LU factor, O(n * bandwidth) per column of b."""
+        n: int = self.width
+        if b.height != n:
+            raise Exception(f"Right-hand side must have {n} rows, not {b.height}")
+
+        band: list[float] = self.__band_factor()
+        if band is None:
+            # A zero pivot needs row swaps, which the band storage cannot hold
+            return super().inverse * b
+
+        content: list[float] = [0] * (b.width * n)
+        for col_number in range(b.width):
+            x: list[float] = list(b.col(col_number))
+
+            # Forward substitution with the unit lower factor
+            for i in range(n):
+                x[i] -= sum([band[self._position(i, k)] * x[k] for k in range(max(0, i - self.lower_bandwidth), i)])
+
+            # Back substitution with the upper factor
+            for i in range(n - 1, -1, -1):
+                x[i] -= sum([band[self._position(i, k)] * x[k] for k in range(i + 1, min(n, i + self.upper_bandwidth + 1))])
+                x[i] /= band[self._position(i, i)]
+
+            for row_number, value in enumerate(x):
+                content[row_number * b.width + col_number] = value
+
+        if type(b) == Vector:
+            return Vector(n, content)
+        return Matrix(b.width, n, content)
+
+    @property
+    def inverse(self) -> Matrix:
+        return self.solve(Identity(self.width))
+
+    def swap_row(self, x: int, y: int) -> None:
+        raise Exception("Swapping rows would break the structure of a BandedMatrix")
+
+    def __getitem__(self, index) -> float:
+        self._check_index(index)
+        self._check_bounds(index)
+        begin, end = self._span(index[0])
+        if begin <= index[1] < end:
+            return self.band[self._position(index[0], index[1])]
+        return 0
+
+    def __setitem__(self, index, value: float) -> None:
+        self._check_index(index)
+        self._check_bounds(index)
+        begin, end = self._span(index[0])
+        if begin <= index[1] < end:
+            self.band[self._position(index[0], index[1])] = value
+        elif value != 0:
+            raise Exception("A BandedMatrix cannot hold non zero values outside of its band")
+
+class Cholesky:
+    """Lower triangular factor L of a symmetric positive definite matrix A = L * L^T.
+
+    Only the lower triangle is stored, packed row by row: row i holds i + 1 values
+    starting at i * (i + 1) / 2, so the factor takes about half the memory of a dense matrix.
+    """
+    def __init__(self, size: int, content: list[float]):
+        if len(content) != size * (size + 1) // 2:
+            raise Exception("Size paramentes do not match with the packed triangle size")
+
+        self.size = size
+        self.content = content
+
+    def __getitem__(self, index) -> float:
+        row, col = index
+        if col > row:
+            return 0.0
+        return self.content[row * (row + 1) // 2 + col]
+
+    @property
+    def L(self) -> "LowerTriangular":
+        # Same packed layout as LowerTriangular
+        return LowerTriangular(self.size, self.content.copy())
+
+    @property
+    def determinant(self) -> float:
+        # det(A) = det(L)^2 and det(L) is the product of its diagonal
+        diagonal: float = 1
+        for i in range(self.size):
+            diagonal *= self.content[i * (i + 1) // 2 + i]
+        return diagonal * diagonal
+
+    def __solve_column(self, b: list[float]) -> list[float]:
+        n: int = self.size
+        packed: list[float] = self.content
+
+        # Forward substitution: L y = b
+        y: list[float] = [0.0] * n
+        for i in range(n):
+            begin: int = i * (i + 1) // 2
+            y[i] = (b[i] - sum([v1 * v2 for v1, v2 in zip(packed[begin : begin + i], y)])) / packed[begin + i]
+
+        # Back substitution: L^T x = y, walking the columns of L as rows of L^T
+        x: list[float] = [0.0] * n
+        for i in range(n - 1, -1, -1):
+            value: float = y[i]
+            for k in range(i + 1, n):
+                value -= packed[k * (k + 1) // 2 + i] * x[k]
+            x[i] = value / packed[i * (i + 1) // 2 + i]
+        return x
+
+    def solve(self, b: Matrix) -> Matrix:
+        """Solve A x = b for x, where b is a Vector or a matrix of right-hand side columns."""
+        if b.height != self.size:
+            raise Exception(f"Right-hand side must have {self.size} rows, not {b.height}")
+
+        content: list[float] = [0.0] * (b.width * b.height)
+        for col_number in range(b.width):
+            x: list[float] = self.__solve_column(list(b.col(col_number)))
+            for row_number, value in enumerate(x):
+                content[row_number * b.width + col_number] = value
+
+        if type(b) == Vector:
+            return Vector(b.height, content)
+        return Matrix(b.width, b.height, content)
+
+    @property
+    def inverse(self) -> Matrix:
+        n: int = self.size
+        content: list[float] = [0.0] * (n * n)
+        for col_number in range(n):
+            unit: list[float] = [0.0] * n
+            unit[col_number] = 1.0
+            for row_number, value in enumerate(self.__solve_column(unit)):
+                content[row_number * n + col_number] = value
+        return Matrix(n, n, content)
+
+class UpdatableInverse:
+    """Keeps the inverse of a matrix up to date under low rank changes.
+
+    A rank-k change A + U C V^T costs O(n² k) through the Sherman-Morrison-Woodbury formula
+    instead of a full re-inversion. Rounding errors accumulate with every update, so with
+    refactor_every the inverse is recomputed from the updated matrix every that many updates.
+    """
+    def __init__(self, matrix: Matrix, inverse = None, refactor_every: int = None, tolerance: float = 1e-12):
+        if matrix.width != matrix.height:
+            raise Exception("Inverse is only defined for square matrices")
+        if refactor_every is not None and (type(refactor_every) != int or refactor_every <= 0):
+            raise Exception(f"refactor_every must be a positive integer, not {refactor_every}")
+
+        # An existing factorization can seed the inverse
+        if isinstance(inverse, Cholesky):
+            inverse = inverse.inverse
+        if inverse is None:
+            inverse = matrix.inverse
+        if inverse.width != matrix.width or inverse.height != matrix.height:
+            raise Exception("Inverse must have the same size as the matrix")
+
+        self.size = matrix.width
+        self.matrix = Matrix(matrix.width, matrix.height, matrix.content.copy())
+        self.inverse = Matrix(inverse.width, inverse.height, inverse.content.copy())
+        self.refactor_every = refactor_every
+        self.tolerance = tolerance
+        self.updates = 0
+
+    def __check_singular(self, capacitance: Matrix) -> None:
+        # The update keeps A invertible only if its small capacitance matrix is, relative to its scale
+        scale: float = 1
+        for row in capacitance.rows:
+            scale *= max(abs(v) for v in row)
+        if abs(capacitance.determinant) <= self.tolerance * scale:
+            raise Exception("Update makes the matrix singular")
+
+    def rank_one_update(self, u: Matrix, v: Matrix) -> Matrix:
+        """Applies A + u v^T (Sherman-Morrison) in O(n²) and returns the updated inverse."""
+        n: int = self.size
+        if u.width != 1 or v.width != 1 or u.height != n or v.height != n:
+            raise Exception(f"Rank one updates need two vectors of size {n}")
+
+        u_values: list[float] = u.content
+        v_values: list[float] = v.content
+        inverse: list[float] = self.inverse.content
+
+        # x = A^-1 u and y^T = v^T A^-1
+        x: list[float] = [sum([v1 * v2 for v1, v2 in zip(inverse[i * n : i * n + n], u_values)]) for i in range(n)]
+        y: list[float] = [0] * n
+        for i, value in enumerate(v_values):
+            if value != 0:
+                y = [v1 + value * v2 for v1, v2 in zip(y, inverse[i * n : i * n + n])]
+
+        denominator = 1 + sum([v1 * v2 for v1, v2 in zip(v_values, x)])
+        self.__check_singular(Matrix(1, 1, [denominator]))
+        if type(denominator) == int:
+            denominator = Fraction(denominator)
+
+        for i in range(n):
+            factor = x[i] / denominator
+            if factor != 0:
+                inverse[i * n : i * n + n] = [v1 - factor * v2 for v1, v2 in zip(inverse[i * n : i * n + n], y)]
+
+        matrix: list[float] = self.matrix.content
+        for i, value in enumerate(u_values):
+            if value != 0:
+                matrix[i * n : i * n + n] = [v1 + value * v2 for v1, v2 in zip(matrix[i * n : i * n + n], v_values)]
+
+        return self.__count_update()
+
+    def low_rank_update(self, U: Matrix, C: Matrix, V: Matrix) -> Matrix:
+        """Applies A + U C V^T (Woodbury) in O(n² k) and returns the updated inverse.
+
+        U and V are n by k and C is k by k.
+        """
+        n: int = self.size
+        k: int = C.width
+        if C.height != k or U.height != n or V.height != n or U.width != k or V.width != k:
+            raise Exception(f"Low rank updates need U and V of size {n} by {k} and C of size {k} by {k}")
+
+        inverse_U: Matrix = self.inverse * U
+        V_T: Matrix = V.T
+        V_T_inverse: Matrix = V_T * self.inverse
+
+        # Capacitance matrix C^-1 + V^T A^-1 U
+        C_inverse: Matrix = C.inverse
+        correction: Matrix = V_T * inverse_U
+        capacitance: Matrix = Matrix(k, k, [v1 + v2 for v1, v2 in zip(C_inverse.content, correction.content)])
+        self.__check_singular(capacitance)
+
+        # A^-1 - A^-1 U (C^-1 + V^T A^-1 U)^-1 V^T A^-1
+        delta: Matrix = inverse_U * (capacitance.inverse * V_T_inverse)
+        inverse: list[float] = self.inverse.content
+        inverse[:] = [v1 - v2 for v1, v2 in zip(inverse, delta.content)]
+
+        change: Matrix = U * (C * V_T)
+        matrix: list[float] = self.matrix.content
+        matrix[:] = [v1 + v2 for v1, v2 in zip(matrix, change.content)]
+
+        return self.__count_update()
+
+    def refactor(self) -> Matrix:
+        """Recomputes the inverse from the updated matrix, discarding accumulated rounding errors."""
+        self.inverse = self.matrix.inverse
+        return self.inverse
+
+    def __count_update(self) -> Matrix:
+        self.updates += 1
+        if self.refactor_every is not None and self.updates % self.refactor_every == 0:
+            return self.refactor()
+        return self.inverse
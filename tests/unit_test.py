@@ -1,4 +1,7 @@
-from matrix import Matrix, Vector
+import io
+from fractions import Fraction
+
+from matrix import Matrix, Vector, DiagonalMatrix, Identity, LowerTriangular, UpperTriangular, BandedMatrix, UpdatableInverse
 
 def test_matrix_operations_pass_fail():
     passed = 0
@@ -121,5 +124,395 @@ def test_matrix_operations_pass_fail():
     print(f"Tests failed: {failed}")
     print(f"Total tests: {passed + failed}")
 
+def test_row_swap_pass_fail():
+    passed = 0
+    failed = 0
+
+    def check(description, condition):
+        nonlocal passed, failed
+        if condition:
+            print(f"PASS: {description}")
+            passed += 1
+        else:
+            print(f"FAIL: {description}")
+            failed += 1
+
+    # swap_row on a non-square matrix (3 columns, 2 rows)
+    M = Matrix(3, 2, [1, 2, 3, 4, 5, 6])
+    M.swap_row(0, 1)
+    check("swap_row on non-square matrix", M.content == [4, 5, 6, 1, 2, 3])
+
+    # Determinants that need a row swap
+    check("Determinant with zero leading pivot", abs(Matrix(3, 3, [0, 1, 2, 1, 0, 3, 4, 5, 6]).determinant - 16) < 1e-9)
+    check("Determinant with zero trailing diagonal", abs(Matrix(2, 2, [1, 2, 3, 0]).determinant - (-6)) < 1e-9)
+
+    print(f"\nTests passed: {passed}")
+    print(f"Tests failed: {failed}")
+    assert failed == 0
+
+def test_cholesky_pass_fail():
+    passed = 0
+    failed = 0
+
+    def check(description, condition):
+        nonlocal passed, failed
+        if condition:
+            print(f"PASS: {description}")
+            passed += 1
+        else:
+            print(f"FAIL: {description}")
+            failed += 1
+
+    def close(m1, m2):
+        return all(abs(a - b) < 1e-9 for a, b in zip(m1.content, m2.content))
+
+    # Symmetric positive definite matrix
+    S = Matrix(3, 3, [4, 12, -16, 12, 37, -43, -16, -43, 98])
+    factor = S.cholesky()
+
+    L_expected = Matrix(3, 3, [2, 0, 0, 6, 1, 0, -8, 5, 3])
+    check("Cholesky factor L", close(factor.L, L_expected))
+    check("Cholesky packed storage", len(factor.content) == 6)
+    check("L * L^T reconstructs S", close(factor.L * factor.L.T, S))
+    check("Cholesky determinant", abs(factor.determinant - 36) < 1e-9)
+
+    identity = Matrix(3, 3, [1, 0, 0, 0, 1, 0, 0, 0, 1])
+    check("S * S^-1 = Identity", close(S * factor.inverse, identity))
+
+    b = Vector(3, [1, 2, 3])
+    x = factor.solve(b)
+    check("Cholesky solve returns a vector", type(x) == Vector)
+    check("S * x = b", close(S * x, b))
+
+    # Multiple right-hand side columns
+    B = Matrix(2, 3, [1, 0, 2, 1, 3, -1])
+    X = factor.solve(B)
+    check("Cholesky solve with matrix right-hand side", X.width == 2 and X.height == 3 and close(S * X, B))
+
+    # Symmetric only up to floating point rounding
+    N = Matrix(2, 2, [2, 0.1 + 0.2, 0.30000000000000004, 2])
+    check("Nearly symmetric float matrix is accepted", abs(N.cholesky().determinant - (4 - 0.09)) < 1e-9)
+
+    # Not symmetric
+    not_symmetric_caught = False
+    try:
+        Matrix(2, 2, [1, 2, 3, 4]).cholesky()
+    except Exception:
+        not_symmetric_caught = True
+    check("Non symmetric matrix raises exception", not_symmetric_caught)
+
+    # Symmetric but indefinite
+    indefinite_caught = False
+    try:
+        Matrix(2, 2, [1, 2, 2, 1]).cholesky()
+    except Exception:
+        indefinite_caught = True
+    check("Indefinite matrix raises exception", indefinite_caught)
+
+    print(f"\nTests passed: {passed}")
+    print(f"Tests failed: {failed}")
+    assert failed == 0
+
+def test_exact_mode_pass_fail():
+    passed = 0
+    failed = 0
+
+    def check(description, condition):
+        nonlocal passed, failed
+        if condition:
+            print(f"PASS: {description}")
+            passed += 1
+        else:
+            print(f"FAIL: {description}")
+            failed += 1
+
+    # Integer determinants stay integers
+    A = Matrix(3, 3, [2, -1, 0, -1, 2, -1, 0, -1, 2])
+    det_A = A.determinant
+    check("Integer determinant is exact", det_A == 4 and type(det_A) == int)
+
+    Z = Matrix(3, 3, [0, 1, 2, 1, 0, 3, 4, 5, 6])
+    check("Integer determinant with row swap", Z.determinant == 16 and type(Z.determinant) == int)
+
+    # Hilbert-like matrix whose float determinant is inexact
+    H = Matrix(3, 3, [Fraction(1, i + j + 1) for i in range(3) for j in range(3)])
+    check("Rational determinant is exact", H.determinant == Fraction(1, 2160))
+
+    # Large entries that overflow float precision
+    big = 10 ** 20
+    B = Matrix(2, 2, [big + 1, big, big, big - 1])
+    check("Determinant of large integers", B.determinant == -1)
+
+    check("Singular integer determinant", Matrix(2, 2, [1, 2, 2, 4]).determinant == 0)
+
+    # Rank
+    check("Rank of full rank matrix", A.rank == 3)
+    check("Rank of rank deficient matrix", Matrix(3, 3, [1, 2, 3, 2, 4, 6, 1, 1, 1]).rank == 2)
+    check("Rank of non-square matrix", Matrix(4, 2, [1, 2, 3, 4, 2, 4, 6, 8]).rank == 1)
+
+    # Inverse with a single common denominator
+    numerators, denominator = A.fraction_free_inverse()
+    check("Common denominator is |det|", denominator == 4)
+    check("Numerators are integers", all(type(v) == int for v in numerators.content))
+    check("Numerators are the adjugate", numerators.content == [3, 2, 1, 2, 4, 2, 1, 2, 3])
+
+    A_inv = A.inverse
+    check("Integer inverse is rational", all(type(v) == Fraction for v in A_inv.content))
+    identity = A * A_inv
+    check("A * A^-1 = Identity exactly", identity.content == [1, 0, 0, 0, 1, 0, 0, 0, 1])
+
+    singular_caught = False
+    try:
+        Matrix(2, 2, [1, 2, 2, 4]).fraction_free_inverse()
+    except Exception:
+        singular_caught = True
+    check("Singular matrix raises exception", singular_caught)
+
+    print(f"\nTests passed: {passed}")
+    print(f"Tests failed: {failed}")
+    assert failed == 0
+
+def test_matrix_power_pass_fail():
+    passed = 0
+    failed = 0
+
+    def check(description, condition):
+        nonlocal passed, failed
+        if condition:
+            print(f"PASS: {description}")
+            passed += 1
+        else:
+            print(f"FAIL: {description}")
+            failed += 1
+
+    def repeated(M, k):
+        result = M
+        for _ in range(k - 1):
+            result = result * M
+        return result
+
+    A = Matrix(3, 3, [1, 2, 0, -1, 1, 3, 2, 0, 1])
+    check("A ** 1 = A", (A ** 1).content == A.content)
+    check("A ** 7 matches repeated multiplication", (A ** 7).content == repeated(A, 7).content)
+    check("A ** 10 matches repeated multiplication", (A ** 10).content == repeated(A, 10).content)
+    check("A ** 0 = Identity", (A ** 0).content == [1, 0, 0, 0, 1, 0, 0, 0, 1])
+
+    # Negative exponents go through a single inverse
+    check("A ** -3 matches repeated inverse multiplication", (A ** -3).content == repeated(A.inverse, 3).content)
+    check("A ** -3 * A ** 3 = Identity", ((A ** -3) * (A ** 3)).content == [1, 0, 0, 0, 1, 0, 0, 0, 1])
+
+    # Structured fast paths
+    D = Matrix(3, 3, [2, 0, 0, 0, -1, 0, 0, 0, 3])
+    check("Diagonal power", (D ** 5).content == repeated(D, 5).content)
+    check("Diagonal negative power", (D ** -2).content == repeated(D.inverse, 2).content)
+
+    U = Matrix(3, 3, [1, 2, 3, 0, 4, 5, 0, 0, 6])
+    check("Upper triangular power", (U ** 6).content == repeated(U, 6).content)
+
+    L = U.T
+    check("Lower triangular power", (L ** 6).content == repeated(L, 6).content)
+
+    # Large exponents on a Markov chain stay stochastic
+    P = Matrix(2, 2, [0.9, 0.1, 0.5, 0.5])
+    P_large = P ** 1000000
+    check("Markov chain converges to stationary distribution", abs(P_large[0, 0] - 5 / 6) < 1e-9 and abs(P_large[1, 0] - 5 / 6) < 1e-9)
+
+    non_square_caught = False
+    try:
+        _ = Matrix(3, 2, [1, 2, 3, 4, 5, 6]) ** 2
+    except Exception:
+        non_square_caught = True
+    check("Power of non-square matrix raises exception", non_square_caught)
+
+    print(f"\nTests passed: {passed}")
+    print(f"Tests failed: {failed}")
+    assert failed == 0
+
+def test_structured_matrices_pass_fail():
+    passed = 0
+    failed = 0
+
+    def check(description, condition):
+        nonlocal passed, failed
+        if condition:
+            print(f"PASS: {description}")
+            passed += 1
+        else:
+            print(f"FAIL: {description}")
+            failed += 1
+
+    def close(m1, m2):
+        return m1.width == m2.width and m1.height == m2.height and all(abs(a - b) < 1e-9 for a, b in zip(m1.content, m2.content))
+
+    def dense(M):
+        return Matrix(M.width, M.height, M.content)
+
+    A = Matrix(3, 3, [1, 2, 0, -1, 1, 3, 2, 0, 1])
+    p = Vector(3, [1, 2, 3])
+
+    # Diagonal
+    D = DiagonalMatrix(3, [2, -1, 3])
+    check("Diagonal compact storage", D.diagonal == [2, -1, 3])
+    check("Diagonal * Matrix scales rows", close(D * A, dense(D) * A))
+    check("Matrix * Diagonal scales columns", close(A * D, A * dense(D)))
+    check("Diagonal * Diagonal stays diagonal", type(D * D) == DiagonalMatrix and (D * D).diagonal == [4, 1, 9])
+    check("Diagonal * Vector returns a vector", type(D * p) == Vector and (D * p).content == [2, -2, 9])
+    check("Diagonal determinant", D.determinant == -6)
+    check("Diagonal inverse", type(D.inverse) == DiagonalMatrix and close(D * D.inverse, Identity(3)))
+
+    # Identity
+    I = Identity(3)
+    check("Identity * Matrix", (I * A).content == A.content)
+    check("Matrix * Identity", (A * I).content == A.content)
+    check("Identity determinant and inverse", I.determinant == 1 and type(I.inverse) == Identity)
+
+    # Triangular
+    L = LowerTriangular(3, [2, 1, 3, -1, 0, 4])
+    U = L.T
+    check("Triangular packed storage", len(L.packed) == 6 and L[0, 1] == 0 and L[2, 1] == 0 and L[2, 2] == 4)
+    check("Transpose of lower is upper", type(U) == UpperTriangular and U.content == dense(L).T.content)
+    check("Lower * Lower stays lower", type(L * L) == LowerTriangular and close(L * L, dense(L) * dense(L)))
+    check("Upper * Upper stays upper", type(U * U) == UpperTriangular and close(U * U, dense(U) * dense(U)))
+    check("Lower * Upper", close(L * U, dense(L) * dense(U)))
+    check("Triangular * Matrix", close(L * A, dense(L) * A) and close(A * U, A * dense(U)))
+    check("Triangular determinant", L.determinant == 24 and U.determinant == 24)
+    check("Triangular inverse stays triangular", type(L.inverse) == LowerTriangular and close(L * L.inverse, Identity(3)))
+    check("Triangular solve", close(U * U.solve(p), p))
+
+    # Banded (tridiagonal)
+    B = BandedMatrix(4, 1, 1, [0, 2, -1, -1, 2, -1, -1, 2, -1, -1, 2, 0])
+    M = Matrix(2, 4, [1, 2, 3, 4, 5, 6, 7, 8])
+    check("Banded compact storage", len(B.band) == 12 and B[0, 2] == 0 and B[1, 0] == -1)
+    check("Banded * Matrix", close(B * M, dense(B) * M))
+    check("Matrix * Banded", close(M.T * B, M.T * dense(B)))
+    check("Banded * Banded widens the band", type(B * B) == BandedMatrix and (B * B).lower_bandwidth == 2 and close(B * B, dense(B) * dense(B)))
+    check("Banded determinant", abs(B.determinant - 5) < 1e-9)
+    check("Banded solve", close(B * B.solve(Vector(4, [1, 0, 0, 1])), Vector(4, [1, 0, 0, 1])))
+    check("Banded inverse", close(B * B.inverse, Identity(4)))
+
+    structure_caught = False
+    try:
+        B[0, 3] = 1
+    except Exception:
+        structure_caught = True
+    check("Writing outside the band raises exception", structure_caught)
+
+    print(f"\nTests passed: {passed}")
+    print(f"Tests failed: {failed}")
+    assert failed == 0
+
+def test_inverse_updates_pass_fail():
+    passed = 0
+    failed = 0
+
+    def check(description, condition):
+        nonlocal passed, failed
+        if condition:
+            print(f"PASS: {description}")
+            passed += 1
+        else:
+            print(f"FAIL: {description}")
+            failed += 1
+
+    def close(m1, m2):
+        return all(abs(a - b) < 1e-9 for a, b in zip(m1.content, m2.content))
+
+    A = Matrix(3, 3, [4.0, 1.0, 0.0, 1.0, 3.0, 1.0, 0.0, 1.0, 2.0])
+    updatable = UpdatableInverse(A)
+
+    # Sherman-Morrison rank one update
+    u = Vector(3, [1.0, 0.0, 2.0])
+    v = Vector(3, [0.5, -1.0, 1.0])
+    updated = updatable.rank_one_update(u, v)
+    expected = Matrix(3, 3, [v1 + v2 for v1, v2 in zip(A.content, (u * v.T).content)])
+    check("Rank one update tracks the matrix", close(updatable.matrix, expected))
+    check("Rank one update matches re-inversion", close(updated, expected.inverse))
+
+    # Woodbury low rank update
+    U = Matrix(2, 3, [1.0, 0.0, 0.0, 1.0, 1.0, 1.0])
+    C = DiagonalMatrix(2, [2.0, -0.5])
+    V = Matrix(2, 3, [0.0, 1.0, 1.0, 0.0, 1.0, 2.0])
+    updated = updatable.low_rank_update(U, C, V)
+    expected = Matrix(3, 3, [v1 + v2 for v1, v2 in zip(expected.content, (U * C * V.T).content)])
+    check("Low rank update matches re-inversion", close(updated, expected.inverse))
+    check("Updates are counted", updatable.updates == 2)
+
+    # Exact inputs stay exact
+    exact = UpdatableInverse(Matrix(2, 2, [2, 1, 1, 3]))
+    exact_inverse = exact.rank_one_update(Vector(2, [1, 0]), Vector(2, [0, 1]))
+    check("Exact update stays rational", exact_inverse.content == [Fraction(3, 4), Fraction(-1, 2), Fraction(-1, 4), Fraction(1, 2)])
+
+    # Seeding from a Cholesky factorization and refactoring periodically
+    S = Matrix(2, 2, [4.0, 2.0, 2.0, 3.0])
+    refactored = UpdatableInverse(S, S.cholesky(), refactor_every=2)
+    refactored.rank_one_update(Vector(2, [1.0, 0.0]), Vector(2, [1.0, 0.0]))
+    first = refactored.inverse
+    refactored.rank_one_update(Vector(2, [0.0, 1.0]), Vector(2, [0.0, 1.0]))
+    check("Inverse is refactored every refactor_every updates", refactored.inverse is not first and close(refactored.inverse, Matrix(2, 2, [5.0, 2.0, 2.0, 4.0]).inverse))
+
+    # Updates that make the matrix singular
+    singular_caught = False
+    try:
+        UpdatableInverse(Matrix(2, 2, [1.0, 0.0, 0.0, 1.0])).rank_one_update(Vector(2, [-1.0, 0.0]), Vector(2, [1.0, 0.0]))
+    except Exception:
+        singular_caught = True
+    check("Singular update raises exception", singular_caught)
+
+    print(f"\nTests passed: {passed}")
+    print(f"Tests failed: {failed}")
+    assert failed == 0
+
+def test_csv_pass_fail():
+    passed = 0
+    failed = 0
+
+    def check(description, condition):
+        nonlocal passed, failed
+        if condition:
+            print(f"PASS: {description}")
+            passed += 1
+        else:
+            print(f"FAIL: {description}")
+            failed += 1
+
+    M = Matrix(3, 2, [0.1, 1 / 3, 2e-300, -5.0, 1e20, 7.0])
+
+    stream = io.StringIO()
+    M.write(stream)
+    check("CSV output keeps full precision", stream.getvalue() == "0.1,0.3333333333333333,2e-300\n-5.0,1e+20,7.0\n")
+
+    # Tiny chunks force rows to be split across reads
+    stream.seek(0)
+    N = Matrix.from_csv(stream, chunk_size=4)
+    check("CSV round trip", N.width == 3 and N.height == 2 and N.content == M.content)
+
+    exact = Matrix.from_csv(io.StringIO("1,2\r\n\r\n3,4\r\n"), parse=int)
+    check("CSV with blank lines and CRLF", exact.content == [1, 2, 3, 4] and exact.determinant == -2)
+
+    rows = list(Matrix.csv_rows(io.StringIO("1/3;2\n3;4"), delimiter=";", parse=Fraction))
+    check("CSV row generator", rows == [[Fraction(1, 3), 2], [3, 4]])
+
+    output = io.StringIO()
+    Matrix.write_csv_rows(([i, i * i] for i in range(3)), output, chunk_size=1)
+    check("CSV row writer", output.getvalue() == "0,0\n1,1\n2,4\n")
+
+    ragged_caught = False
+    try:
+        Matrix.from_csv(io.StringIO("1,2\n3\n"))
+    except Exception:
+        ragged_caught = True
+    check("Ragged CSV raises exception", ragged_caught)
+
+    print(f"\nTests passed: {passed}")
+    print(f"Tests failed: {failed}")
+    assert failed == 0
+
 if __name__ == "__main__":
     test_matrix_operations_pass_fail()
+    test_row_swap_pass_fail()
+    test_cholesky_pass_fail()
+    test_exact_mode_pass_fail()
+    test_matrix_power_pass_fail()
+    test_structured_matrices_pass_fail()
+    test_inverse_updates_pass_fail()
+    test_csv_pass_fail()